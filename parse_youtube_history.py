@@ -1,28 +1,99 @@
 import re
 import os
+import sys
 import time
+import pickle
+import argparse
 from typing import Any
-from bs4 import BeautifulSoup
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from collections import Counter, defaultdict
 from tqdm import tqdm
-from multiprocessing import Pool
-import plotly.express as px
+from lxml import etree
 
 records: list[dict[str, Any]] = []
 
-# Mapeamento dos meses em português para abreviações em inglês
+# Visões dos registros montadas uma vez em index_records: registros ordenados por data, registros sem
+# propagandas (na ordem do arquivo e ordenados por data), propagandas, registros agrupados por ano
+# (vídeos sem propagandas e propagandas) e vídeos sem propagandas agrupados por mês (YYYY-MM) e por dia
+records_by_date: list[dict[str, Any]] = []
+records_without_ads: list[dict[str, Any]] = []
+records_without_ads_by_date: list[dict[str, Any]] = []
+ad_records: list[dict[str, Any]] = []
+videos_by_year: dict[int, list[dict[str, Any]]] = {}
+ads_by_year: dict[int, list[dict[str, Any]]] = {}
+videos_by_month: dict[str, list[dict[str, Any]]] = {}
+videos_by_day: dict[date, list[dict[str, Any]]] = {}
+
+# Mapeamento dos meses abreviados em português para seus números
 meses = {
-    "jan.": "Jan", "fev.": "Feb", "mar.": "Mar", "abr.": "Apr",
-    "mai.": "May", "jun.": "Jun", "jul.": "Jul", "ago.": "Aug",
-    "set.": "Sep", "out.": "Oct", "nov.": "Nov", "dez.": "Dec"
+    "jan.": 1, "fev.": 2, "mar.": 3, "abr.": 4,
+    "mai.": 5, "jun.": 6, "jul.": 7, "ago.": 8,
+    "set.": 9, "out.": 10, "nov.": 11, "dez.": 12
 }
 
+# Versão do formato dos registros salvos no cache; deve mudar sempre que os campos de parse_single_record mudarem
+CACHE_VERSION = 2
+
+# Expressões regulares das datas, compiladas uma única vez: componentes da data e data dentro do texto do registro
+DATE_RE = re.compile(r"(\d+)\s+de\s+(\w+\.)\s+de\s+(\d+),\s+(\d+):(\d+):(\d+)")
+DATE_SEARCH_RE = re.compile(r"\d+\s+de\s+\w+\.\s+de\s+\d+,\s+\d+:\d+:\d+")
+# Dia com um único dígito no início de uma data que contém vírgula (data, hora)
+FORMAT_DATE_RE = re.compile(r"^(\d) de (?=[^,]*,)")
+
+# Expressões XPath compiladas uma única vez para extrair os campos de cada registro
+BODY_CELL_XPATH = etree.XPath(".//div[contains(concat(' ', normalize-space(@class), ' '), ' content-cell ')"
+                              " and contains(concat(' ', normalize-space(@class), ' '), ' mdl-typography--body-1 ')]")
+VIDEO_LINK_XPATH = etree.XPath(".//a[contains(@href, 'https://www.youtube.com/watch')]")
+CHANNEL_LINK_XPATH = etree.XPath(".//a[contains(@href, 'https://www.youtube.com/channel')]")
+TEXT_NODES_XPATH = etree.XPath("text()")
+DETAILS_XPATH = etree.XPath("(.//div[contains(concat(' ', normalize-space(@class), ' '), ' mdl-typography--caption ')])[1]"
+                            "/b[starts-with(normalize-space(.), 'Detalhes')]/following-sibling::text()[normalize-space()][1]")
+
 
 def line():
     print("-" * 100)
 
 
+def print_block(lines):
+    """
+    Print a block of result lines between separator lines using a single write.
+
+    Parameters:
+        lines (iterable): Lines to print, without trailing newlines.
+
+    Returns:
+        None
+    """
+    sys.stdout.write("\n".join(["-" * 100, *lines, "-" * 100]) + "\n")
+
+
+def show_bar(x, y, title, x_title, y_title):
+    """
+    Show a bar chart built directly with plotly.graph_objects.
+
+    The values are handed straight to a Bar trace, skipping the dataframe building
+    and schema inference that Plotly Express (px.bar) does on every call. Plotly is only
+    imported on the first chart, so the options that just print results start faster.
+
+    Parameters:
+        x (sequence): Values for the x axis.
+        y (sequence): Values for the y axis.
+        title (str): Chart title.
+        x_title (str): Title of the x axis.
+        y_title (str): Title of the y axis.
+
+    Returns:
+        None
+    """
+    # Importado só quando um gráfico é pedido (depois da primeira vez, vem do cache de módulos)
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Bar(x=x, y=y))
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title)
+    fig.show()
+
+
 def save_results_records(total_records): # Debug
     """
     Save a subset of record dictionaries to a file for debugging purposes.
@@ -69,33 +140,16 @@ def sort(records_to_sort):
     return sorted_records
 
 
-def record_without_ad(r):
-    """
-    Check if a record does not contain advertisement information.
-
-    This function verifies if the string "From Google Ads" is absent from the record's 
-    "details" value. If the substring is not found, the function returns True,
-    indicating that the record is not an advertisement.
-
-    Parameters:
-        r (dict): A record dictionary that is expected to have a "details" key.
-
-    Returns:
-        bool: True if the record does not contain ad-related details, False otherwise.
-    """
-    if "From Google Ads" not in r.get("details", ""):
-        return True
-    return False
-
-
+@lru_cache(maxsize=1 << 17)
 def convert_date(date_str):
     """
     Convert a formatted date string into a datetime object.
 
-    The function removes the timezone "BRT" from the string, then uses a regular expression
-    to extract the day, abbreviated month in Brazilian Portuguese, year, and time.
-    It converts the month to its English abbreviated form using the 'meses' mapping and attempts
-    to create and return a datetime object.
+    The function removes the timezone "BRT" from the string, then uses the precompiled DATE_RE expression
+    to extract the day, abbreviated month in Brazilian Portuguese, year, hour, minute and second.
+    It converts the month to its number using the 'meses' mapping and builds the datetime object
+    directly from the integer components, without going through strptime.
+    Results are memoized on the raw string, since the same view date often appears in several records.
     
     Parameters:
         date_str (str): Date string in the format "DD de Mês. de YYYY, HH:MM:SS" with optional "BRT".
@@ -105,27 +159,26 @@ def convert_date(date_str):
     """
     # Remove o fuso horário e quebra a string
     date_str = date_str.replace("BRT", "").strip()
-    # Expressão regular para extrair dia, mês e ano, e horário
-    pattern = r"(\d+)\s+de\s+(\w+\.)\s+de\s+(\d+),\s+(\d+:\d+:\d+)"
-    match = re.search(pattern, date_str)
+    # Extrai dia, mês, ano, hora, minuto e segundo (a string começa pelo dia)
+    match = DATE_RE.match(date_str)
     if match:
-        dia, mes_br, ano, horario = match.groups()
-        mes_en = meses.get(mes_br.lower(), mes_br)
-        formatted_date = f"{dia} {mes_en} {ano}, {horario}"
+        dia, mes_br, ano, hora, minuto, segundo = match.groups()
         try:
-            return datetime.strptime(formatted_date, "%d %b %Y, %H:%M:%S")
-        except Exception as e:
-            print(f"Erro ao converter data '{formatted_date}': {e}")
+            return datetime(int(ano), meses[mes_br.lower()], int(dia), int(hora), int(minuto), int(segundo))
+        except (KeyError, ValueError) as e:
+            print(f"Erro ao converter data '{date_str}': {e}")
     return None
 
 
+@lru_cache(maxsize=1 << 15)
 def format_date(date_str):
     """
     Format a date string by ensuring the day is zero-padded if necessary.
 
     The function expects the date string to contain a comma separating the date and time.
-    It splits the string to isolate the day component and zero-pads the day if it is only one digit.
+    A single precompiled substitution zero-pads the leading day if it is only one digit.
     If the string does not follow the expected format, the original string is returned.
+    Results are memoized, since the same view date strings are listed again on every menu call.
 
     Parameters:
         date_str (str): A date string in the format "D de ... , time".
@@ -133,98 +186,124 @@ def format_date(date_str):
     Returns:
         str: The formatted date string, or the original string if the format is unexpected.
     """
-    # Separa a data e a hora pela vírgula
-    try:
-        data, hora = date_str.split(',', 1)
-    except ValueError:
-        # Se não houver vírgula, retorna a string original
-        return date_str
+    # Preenche o dia com zero à esquerda se tiver apenas um dígito
+    return FORMAT_DATE_RE.sub(r"0\1 de ", date_str)
 
-    # Separa o dia dos demais componentes (assumindo que o primeiro token é o dia)
-    partes = data.split(" de ", 1)
-    if len(partes) != 2:
-        return date_str  # formato inesperado, retorna original
 
-    dia, resto = partes
-    # Preenche o dia com zero à esquerda se tiver apenas um dígito
-    dia_formatado = dia.zfill(2)
-    # Reconstrói a data
-    return f"{dia_formatado} de {resto},{hora}"
+def iter_outer_cells(file):
+    """
+    Stream the "outer-cell" elements of the history file one at a time.
 
+    The file is read with lxml's iterparse, so records are yielded while the file is still being parsed.
+    Once the caller is done with a cell, it is cleared and the already processed cells before it are
+    removed from the tree, keeping memory usage flat regardless of the file size.
 
-def parse_single_record(cell_html):
+    Parameters:
+        file (file object): The history HTML file, opened in binary mode.
+
+    Yields:
+        lxml.etree._Element: Each "outer-cell" element, fully parsed.
+    """
+    for _, elem in etree.iterparse(file, events=("end",), tag="div", html=True, encoding="utf-8"):
+        if "outer-cell" in (elem.get("class") or "").split():
+            yield elem
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+
+def parse_single_record(cell):
     """
-    Parse an HTML snippet to extract video record details.
+    Extract video record details from an "outer-cell" element.
 
-    This function uses BeautifulSoup to parse the provided HTML (cell_html), searching for specific
-    elements that contain video details like title, link, channel information, and view date.
+    This function runs the precompiled XPath expressions against the lxml element of a single record cell,
+    looking for the elements that contain video details like title, link, channel information, and view date.
     It extracts the video title, video link, channel name, channel link, the raw view date string,
-    its converted datetime form, and additional details if present.
+    its converted datetime form with its year, date part and "YYYY-MM-DD" / "YYYY-MM" keys, and additional details if present.
     
     Parameters:
-        cell_html (str): A string containing HTML of a single record cell.
+        cell (lxml.etree._Element): The "outer-cell" element of a single record.
 
     Returns:
         dict or None: A dictionary with the extracted fields:
             - "video_title"
+            - "video_title_lower" (lowercase title, used by the title search)
             - "video_link"
             - "channel_name"
+            - "channel_name_lower" (lowercase channel name, used by the channel filter)
             - "channel_link"
             - "view_date"
             - "view_date_str"
+            - "year" (year of the view date)
+            - "month" (month of the view date, 1-12)
+            - "day" (day of the month of the view date, 1-31)
+            - "hour" (hour of the view date, 0-23)
+            - "weekday" (weekday of the view date, 0 for Monday through 6 for Sunday)
+            - "view_day" (date part of the view date)
+            - "day_str" (view date as "YYYY-MM-DD")
+            - "ym_str" (view date as "YYYY-MM")
             - "details"
+            - "is_ad" (True when the details contain "From Google Ads")
         or None if the necessary elements cannot be found.
     """
-    outer = BeautifulSoup(cell_html, "lxml")
-    
-    content_cells = outer.find_all("div", class_="content-cell")
-    if not content_cells:
-        return None
-
-    body_cell = next((cell for cell in content_cells if "mdl-typography--body-1" in cell.get("class", [])), None)
-    if not body_cell:
+    body_cells = BODY_CELL_XPATH(cell)
+    if not body_cells:
         return None
 
-    video_link_tag = body_cell.find("a", href=re.compile("https://www.youtube.com/watch"))
-    if not video_link_tag:
+    video_links = VIDEO_LINK_XPATH(body_cells[0])
+    if not video_links:
         return None
 
-    video_title = video_link_tag.text.strip()
+    video_link_tag = video_links[0]
+    video_title = "".join(video_link_tag.itertext()).strip()
     video_link = video_link_tag.get("href")
     
-    channel_link_tag = video_link_tag.find_next("a", href=re.compile("https://www.youtube.com/channel"))
-    channel_name = channel_link_tag.text.strip() if channel_link_tag else ""
-    channel_link = channel_link_tag.get("href") if channel_link_tag else ""
+    channel_links = CHANNEL_LINK_XPATH(cell)
+    channel_name = "".join(channel_links[0].itertext()).strip() if channel_links else ""
+    channel_link = channel_links[0].get("href") if channel_links else ""
     
-    remaining_text = video_link_tag.parent.get_text(separator=" ", strip=True)
-    date_match = re.search(r'\d+\s+de\s+\w+\.\s+de\s+\d+,\s+\d+:\d+:\d+', remaining_text)
-    view_date_str = date_match.group(0) if date_match else ""
+    # A data fica em um nó de texto direto do bloco do vídeo (depois do último <br>), então
+    # esses nós são verificados do fim para o início, sem juntar todo o texto do bloco
+    view_date_str = ""
+    for text in reversed(TEXT_NODES_XPATH(video_link_tag.getparent())):
+        date_match = DATE_SEARCH_RE.search(text)
+        if date_match:
+            view_date_str = date_match.group(0)
+            break
     view_date = convert_date(view_date_str) if view_date_str else None
-
-    caption_cell = outer.find("div", class_="mdl-typography--caption")
-    details = ""
-    if caption_cell:
-        children = [child for child in caption_cell.children if not (isinstance(child, str) and child.strip() == "")]
-        children = list(children)
-        for i, child in enumerate(children):
-            if getattr(child, "name", None) == "b":
-                label = child.get_text(strip=True)
-                if label.startswith("Detalhes"):
-                    if i + 1 < len(children):
-                        next_item = children[i+1]
-                        if getattr(next_item, "name", None) == "br" and i + 2 < len(children):
-                            details = str(children[i+2]).strip()
-                        else:
-                            details = str(next_item).strip()
+    # Chaves de data usadas pelas análises, calculadas uma vez por registro
+    year = view_date.year if view_date else None
+    month = view_date.month if view_date else None
+    day = view_date.day if view_date else None
+    hour = view_date.hour if view_date else None
+    weekday = view_date.weekday() if view_date else None
+    view_day = view_date.date() if view_date else None
+    day_str = view_day.isoformat() if view_day else None
+    ym_str = day_str[:7] if day_str else None
+
+    # Texto logo após o rótulo "Detalhes" (depois do <br>) na legenda do registro
+    details_texts = DETAILS_XPATH(cell)
+    details = details_texts[-1].strip() if details_texts else ""
     
     return {
         "video_title": video_title,
+        "video_title_lower": video_title.lower(),
         "video_link": video_link,
         "channel_name": channel_name,
+        "channel_name_lower": channel_name.lower(),
         "channel_link": channel_link,
         "view_date": view_date,
         "view_date_str": view_date_str,
-        "details": details
+        "year": year,
+        "month": month,
+        "day": day,
+        "hour": hour,
+        "weekday": weekday,
+        "view_day": view_day,
+        "day_str": day_str,
+        "ym_str": ym_str,
+        "details": details,
+        "is_ad": "From Google Ads" in details
     }
 
 
@@ -232,9 +311,11 @@ def parse_html(file_path):
     """
     Parse an HTML file to extract all video records.
 
-    This function reads an HTML file from the given file path, processes the file using BeautifulSoup,
-    and extracts all elements with the class "outer-cell". Each cell is parsed by the parse_single_record function
-    using a multiprocessing pool with a progress bar (via tqdm). After filtering out any None records, the function
+    This function streams the elements with the class "outer-cell" from the HTML file at the given path
+    (via iter_outer_cells) and hands each one to the parse_single_record function as soon as it is parsed,
+    in a single process with a progress bar (via tqdm), keeping only the cells that yield a record. The function then
+    interns the repeated text fields (titles, links, channel names and details) so each distinct value is stored once
+    and later counting can compare them by identity,
     optionally saves the records for debugging (if configured) and prints the processing time.
 
     Parameters:
@@ -245,15 +326,17 @@ def parse_html(file_path):
     """
     start_time = time.time()
 
-    with open(file_path, encoding="utf-8") as f:
-        soup = BeautifulSoup(f, "lxml")
-  
-    outer_cells = [str(cell) for cell in soup.find_all("div", class_="outer-cell")]
-    
-    with Pool() as pool:
-        records = list(tqdm(pool.imap(parse_single_record, outer_cells), total=len(outer_cells), desc="Processing records", unit="record"))
+    with open(file_path, "rb") as f:
+        # A barra só confere o relógio a cada 1000 registros e redesenha no máximo a cada 0,5 s
+        cells = tqdm(iter_outer_cells(f), desc="Processing records", unit="record", mininterval=0.5, miniters=1000)
+        records = [record for record in map(parse_single_record, cells) if record is not None]
 
-    records = [records for records in records if records is not None]
+    # Interna os campos de texto que se repetem muito: as contagens comparam por identidade
+    # e cada valor distinto fica uma única vez na memória
+    for r in records:
+        for key in ("video_title", "video_title_lower", "video_link", "channel_name", "channel_name_lower",
+                    "channel_link", "details"):
+            r[key] = sys.intern(r[key])
     
     # Change to True to test if it works
     if False: 
@@ -268,12 +351,98 @@ def parse_html(file_path):
     return records
 
 
+def load_records(file_path, quiet=False):
+    """
+    Load the records of the history file, reusing a cached parse while the file is unchanged.
+
+    The parsed records are saved with pickle next to the history file (same name plus ".pkl"),
+    together with CACHE_VERSION and the modification time and size of the file they came from. When the cache exists
+    and was made from the current version of the file with the current record format, it is loaded directly
+    and parse_html is skipped; otherwise (including when the cache is unreadable or corrupted) the file is parsed
+    and the cache is rewritten. The new cache is written to a temporary file that then replaces the old one, so an
+    interrupted run never leaves a partial cache behind, and a failure to write it does not stop the analysis.
+
+    Parameters:
+        file_path (str): The path to the HTML file containing the records.
+        quiet (bool): When True, does not print the message about loading from the cache.
+
+    Returns:
+        list: A list of record dictionaries, as returned by parse_html.
+    """
+    cache_path = file_path + ".pkl"
+    source_stat = os.stat(file_path)
+    cache_key = (CACHE_VERSION, source_stat.st_mtime, source_stat.st_size)
+
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                cached_key, cached_records = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError, AttributeError, ImportError) as e:
+            # Cache corrompido ou de um formato antigo: o arquivo é processado novamente
+            print(f"Cache '{cache_path}' ignorado ({e}).")
+        else:
+            if cached_key == cache_key:
+                if not quiet:
+                    print(f"Registros carregados do cache '{cache_path}'.")
+                return cached_records
+
+    parsed_records = parse_html(file_path)
+    # Grava em um arquivo temporário e só então substitui o cache, para nunca deixar um cache pela metade
+    temp_path = cache_path + ".tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            pickle.dump((cache_key, parsed_records), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"Não foi possível salvar o cache '{cache_path}': {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return parsed_records
+
+
+def index_records():
+    """
+    Build the derived views of the loaded records once, so the analyses do not refilter or rescan all records.
+
+    Fills the module-level views:
+        - records_by_date: all records sorted by view date
+        - records_without_ads: records without ads, in their original order
+        - records_without_ads_by_date: records without ads sorted by view date
+        - ad_records: advertisement records, in their original order
+        - videos_by_year / ads_by_year: records without ads / advertisement records grouped by year, in their original order
+        - videos_by_month: records without ads grouped by "YYYY-MM" month, in their original order
+        - videos_by_day: records without ads grouped by view day, sorted by view date
+    Records without a view date are left out of the sorted lists and of the groups. Since the sort is stable,
+    any filter applied to a sorted list gives the same order as filtering first and sorting after.
+
+    Returns:
+        None
+    """
+    records_by_date[:] = sort(r for r in records if r["view_date"] is not None)
+    records_without_ads[:] = [r for r in records if not r["is_ad"]]
+    records_without_ads_by_date[:] = [r for r in records_by_date if not r["is_ad"]]
+    ad_records[:] = [r for r in records if r["is_ad"]]
+    videos_by_year.clear()
+    ads_by_year.clear()
+    videos_by_month.clear()
+    for r in records:
+        if r["view_date"] is not None:
+            if r["is_ad"]:
+                ads_by_year.setdefault(r["year"], []).append(r)
+            else:
+                videos_by_year.setdefault(r["year"], []).append(r)
+                videos_by_month.setdefault(r["ym_str"], []).append(r)
+    videos_by_day.clear()
+    for r in records_without_ads_by_date:
+        videos_by_day.setdefault(r["view_day"], []).append(r)
+
+
 def list_first_videos(): # 1
     """
     List the first N videos (excluding ads) sorted by view date.
 
-    Prompts the user for the number of records to list, filters out any advertisement records,
-    sorts the remaining records by view date, and then prints a formatted list with the view date,
+    Prompts the user for the number of records to list, takes them from the start of the
+    ad-free records already sorted by view date in index_records, and then prints a formatted list with the view date,
     video title, and channel name. The formatting is adjusted using the format_date function.
 
     Returns:
@@ -281,11 +450,7 @@ def list_first_videos(): # 1
     """
     quantity = int(input("Quantidade de registros para listar: "))
 
-    filtered_records = [
-        r for r in records 
-        if record_without_ad(r)
-    ]
-    filtered_records = sort(filtered_records)[:quantity]
+    filtered_records = records_without_ads_by_date[:quantity]
 
     line()
     for r in filtered_records:
@@ -299,21 +464,21 @@ def list_first_videos_by_year(): # 2
     List the first N videos per year (excluding ads) sorted by view date.
 
     The function prompts the user for the number of records to list for each year.
-    It groups the records by year (using the "view_date" field), sorts each yearly group,
-    and then prints the results in a structured format, displaying the year and corresponding videos.
+    It walks the ad-free records already sorted by view date in index_records and keeps the first N
+    of each year, so no yearly group has to be sorted, and then prints the results in a structured format,
+    displaying the year and corresponding videos.
 
     Returns:
         None
     """
     quantity = int(input("Quantidade de registros por ano para listar: "))
 
+    # Os registros já estão em ordem de data: basta guardar os primeiros de cada ano
     date_by_year = defaultdict(list)
-    for r in records:
-        if record_without_ad(r):
-            year = r["view_date"].year
-            date_by_year[year].append(r)
-    for year in date_by_year:
-        date_by_year[year] = sort(date_by_year[year])[:quantity]
+    for r in records_without_ads_by_date:
+        year_records = date_by_year[r["year"]]
+        if len(year_records) < quantity:
+            year_records.append(r)
     
     line()
     for year in sorted(date_by_year.keys()):
@@ -329,17 +494,16 @@ def list_by_channel(): # 3
     List videos from a specified channel.
 
     Prompts the user for a channel name or part of it as well as the desired number of records.
-    Filters records to include only those where the channel name contains the provided substring (case-insensitive),
-    sorts the filtered list by view date, and then prints each video's formatted view date, title, and channel name.
+    Filters the records already sorted by view date to include only those where the channel name contains
+    the provided substring (case-insensitive), and then prints each video's formatted view date, title, and channel name.
 
     Returns:
         None
     """
-    channel = input("Nome (ou parte do nome) do canal: ")
+    channel = input("Nome (ou parte do nome) do canal: ").lower()
     quantity = int(input("Quantidade para listar: "))
     
-    filtered = [r for r in records if channel.lower() in r["channel_name"].lower()]
-    filtered = sort(filtered)[:quantity]
+    filtered = [r for r in records_by_date if channel in r["channel_name_lower"]][:quantity]
     
     line()
     for r in filtered:
@@ -360,11 +524,7 @@ def most_watched_videos(): # 4
     """
     quantity = int(input("Quantidade de registros para listar: "))
 
-    filtered_records = [
-        r for r in records 
-        if record_without_ad(r)
-    ]
-    count = Counter(r["video_title"] for r in filtered_records)
+    count = Counter(r["video_title"] for r in records_without_ads)
     results = count.most_common(quantity)
     
     line()
@@ -378,21 +538,16 @@ def most_watched_videos_by_year(): # 5
     Display the most-watched videos for each year (excluding ads).
 
     Prompts the user for the number of top records per year to list.
-    Groups video titles by the year of the view date, counts the frequency within each group, and prints the most common videos per year.
+    Uses the per-year groups built by index_records, counts the video title frequency within each year, and prints the most common videos per year.
 
     Returns:
         None
     """
     quantity = int(input("Quantidade de registros para listar: "))
 
-    date_by_year = defaultdict(list)
-    for r in records:
-        if record_without_ad(r):
-            year = r["view_date"].year
-            date_by_year[year].append(r["video_title"])
     results = {}
-    for year, videos in date_by_year.items():
-        cont = Counter(videos)
+    for year, year_records in videos_by_year.items():
+        cont = Counter(r["video_title"] for r in year_records)
         results[year] = cont.most_common(quantity)
 
     line()
@@ -415,11 +570,7 @@ def most_watched_channels(): # 6
     """
     quantity = int(input("Quantidade de registros para listar: "))
     
-    filtered_records = [
-        r for r in records 
-        if record_without_ad(r)
-    ]
-    count = Counter(r["channel_name"] for r in filtered_records)
+    count = Counter(r["channel_name"] for r in records_without_ads)
     results = count.most_common(quantity)
 
     line()
@@ -432,7 +583,7 @@ def most_watched_channels_by_year(): # 7
     """
     List the most-watched channels for each year (excluding ads).
 
-    Prompts the user for the number of top channels per year, groups records by year,
+    Prompts the user for the number of top channels per year, uses the per-year groups built by index_records,
     counts the frequency of channel names within each year, and prints the top channels along with their counts.
 
     Returns:
@@ -440,14 +591,9 @@ def most_watched_channels_by_year(): # 7
     """
     quantity = int(input("Quantidade de registros para listar: "))
     
-    date_by_year = defaultdict(list)
-    for r in records:
-        if record_without_ad(r):
-            year = r["view_date"].year
-            date_by_year[year].append(r["channel_name"])
     results = {}
-    for year, channels in date_by_year.items():
-        cont = Counter(channels)
+    for year, year_records in videos_by_year.items():
+        cont = Counter(r["channel_name"] for r in year_records)
         results[year] = cont.most_common(quantity)
 
     line()
@@ -470,11 +616,7 @@ def most_watched_days(): # 8
     """
     quantity = int(input("Quantidade de registros para listar: "))
     
-    count = Counter()
-    for r in records:
-        if record_without_ad(r):
-            day = r["view_date"].strftime("%Y-%m-%d")
-            count[day] += 1
+    count = Counter(r["day_str"] for r in records_without_ads)
     results = count.most_common(quantity)
 
     line()
@@ -488,7 +630,7 @@ def most_watched_days_by_year(): # 9
     List the most active viewing days for each year (excluding ads).
 
     Prompts the user for the number of top records to list per year,
-    groups the records by year and then by day, counts video frequencies per day,
+    uses the per-year groups built by index_records, counts video frequencies per day,
     and prints the top days with the number of videos for each year.
 
     Returns:
@@ -496,15 +638,9 @@ def most_watched_days_by_year(): # 9
     """
     quantity = int(input("Quantidade de registros para listar: "))
 
-    date_by_year = defaultdict(list)
-    for r in records:
-        if record_without_ad(r):
-            year = r["view_date"].year
-            day = r["view_date"].strftime("%Y-%m-%d")
-            date_by_year[year].append(day)
     results = {}
-    for year, days in date_by_year.items():
-        cont = Counter(days)
+    for year, year_records in videos_by_year.items():
+        cont = Counter(r["day_str"] for r in year_records)
         results[year] = cont.most_common(quantity)
     
     line()
@@ -515,12 +651,25 @@ def most_watched_days_by_year(): # 9
     line()
 
 
+def videos_for_date(target_date):
+    """
+    Return the videos (excluding ads) watched on a given date, sorted by view date.
+
+    Parameters:
+        target_date (datetime.date): The date to look up.
+
+    Returns:
+        list: The record dictionaries of that date, taken from videos_by_day (empty if there are none).
+    """
+    return videos_by_day.get(target_date, [])
+
+
 def list_videos_by_date(): # 10
     """
     List all videos (excluding ads) for a specific date.
 
     Prompts the user to input a date in the format YYYY-MM-DD. Converts the string to a datetime object,
-    filters the records to those matching the target date, sorts them by view date,
+    looks up the ad-free records of that day (already sorted by view date) with videos_for_date,
     and prints each video's information along with the total number of videos watched on that date.
 
     Returns:
@@ -530,10 +679,7 @@ def list_videos_by_date(): # 10
     
     # Converte a string para objeto datetime.date
     target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-    videos = [
-        r for r in records
-        if record_without_ad(r) and r["view_date"].date() == target_date]
-    results = sort(videos)
+    results = videos_for_date(target_date)
 
     line()
     print(f"Quantidade de vídeos assistidos em {date_str}: {len(results)}")
@@ -547,7 +693,7 @@ def list_channels_by_date(): # 11
     List all unique channels for videos watched on a specific date.
 
     Prompts the user to input a date (YYYY-MM-DD), converts the string to a datetime.date object,
-    and then filters and groups records (excluding ads) by that date. Prints the channel names and links,
+    and then groups the records (excluding ads) of that date, taken from videos_for_date, by channel. Prints the channel names and links,
     along with the total count of unique channels viewed on the specified date.
 
     Returns:
@@ -557,10 +703,9 @@ def list_channels_by_date(): # 11
 
     target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
     channels = {}
-    for r in records:
-        if record_without_ad(r) and r["view_date"].date() == target_date:
-            if r["channel_name"] not in channels:
-                channels[r["channel_name"]] = r["channel_link"]
+    for r in videos_for_date(target_date):
+        if r["channel_name"] not in channels:
+            channels[r["channel_name"]] = r["channel_link"]
     channels_list = [{"channel_name": name, "channel_link": link} for name, link in channels.items()]
     results = sorted(channels_list, key=lambda x: x["channel_name"])
 
@@ -576,8 +721,8 @@ def search_by_title(): # 12
     Search for videos by keywords in their title.
 
     Prompts the user for search terms separated by spaces and groups (separated by commas).
-    The function then filters the records (excluding ads) to those whose titles contain all the terms
-    of at least one group. The matching records are sorted by view date and printed along with the total count found.
+    The function then filters the ad-free records, already sorted by view date, to those whose titles (lowercased once at
+    parse time) contain all the terms of at least one group. The matching records are printed in that order along with the total count found.
 
     Returns:
         None
@@ -595,11 +740,15 @@ def search_by_title(): # 12
         [term.strip().lower() for term in group.split() if term.strip()]
         for group in groups
     ]
-    results = [
-        r for r in records
-        if record_without_ad(r) and any(all(term in r["video_title"].lower() for term in group) for group in groups_terms)
-    ]
-    results = sort(results)
+    if len(groups_terms) == 1 and len(groups_terms[0]) == 1:
+        # Caso mais comum (um único termo): um só teste de substring por título, sem any/all
+        term = groups_terms[0][0]
+        results = [r for r in records_without_ads_by_date if term in r["video_title_lower"]]
+    else:
+        results = [
+            r for r in records_without_ads_by_date
+            if any(all(term in r["video_title_lower"] for term in group) for group in groups_terms)
+        ]
 
     line()
     for r in results:
@@ -612,61 +761,54 @@ def plot_videos_day(): # 13
     """
     Plot a bar chart of videos watched on a specific day.
 
-    Prompts the user for a date (YYYY-MM-DD), retrieves the videos for that day by calling list_videos_by_date,
+    Prompts the user for a date (YYYY-MM-DD) once, retrieves the videos for that day with videos_for_date,
     and then prints the total videos watched on that date. It also counts the occurrences of each video title and plots
-    a bar chart using Plotly Express.
-
-    Note:
-        The function list_videos_by_date() is called and is expected to return the list of videos.
+    a bar chart.
 
     Returns:
         None
     """
     date_str = input("Data para listar (YYYY-MM-DD): ").strip()
     
-    videos = list_videos_by_date()
+    videos = videos_for_date(datetime.strptime(date_str, "%Y-%m-%d").date())
     total = len(videos)
     line()
     print(f"Quantidade de vídeos assistidos em {date_str}: {total}")
     line()
 
     count = Counter(r["video_title"] for r in videos)
-    graph_data = [{"Video title": title, "Count": count} for title, count in count.items()]
-    fig = px.bar(graph_data, x="Video title", y="Count", title=f"Vídeos assistidos em {date_str}")
-    fig.show()
+    show_bar(list(count.keys()), list(count.values()), f"Vídeos assistidos em {date_str}", "Video title", "Count")
 
 
 def plot_videos_month(): # 14
     """
     Plot a bar chart of videos watched per day within a specified month.
 
-    Prompts the user for a month in the format YYYY-MM, filters records to that month (excluding ads),
+    Prompts the user for a month in the format YYYY-MM, takes the records of that month (excluding ads) from videos_by_month,
     and prints the total number of videos watched. It then counts the number of videos watched on each day and
-    generates a bar chart using Plotly Express.
+    generates a bar chart.
 
     Returns:
         None
     """
     month_str = input("Mês para listar (YYYY-MM): ").strip()
     
-    month_records = [r for r in records if r["view_date"].strftime("%Y-%m") == month_str and record_without_ad(r)]
+    month_records = videos_by_month.get(month_str, [])
     total = len(month_records)
     line()
     print(f"Quantidade de vídeos assistidos em {month_str}: {total}")
     line()
 
-    count = Counter(r["view_date"].strftime("%Y-%m-%d") for r in month_records)
-    graph_data = [{"Day": day, "Count": count} for day, count in count.items()]
-    fig = px.bar(graph_data, x="Day", y="Count", title=f"Vídeos assistidos por dia em {month_str}")
-    fig.show()
+    count = Counter(r["day_str"] for r in month_records)
+    show_bar(list(count.keys()), list(count.values()), f"Vídeos assistidos por dia em {month_str}", "Day", "Count")
 
 
 def plot_videos_year(): # 15
     """
     Plot bar charts of videos watched per month and total for a specified year.
 
-    Prompts the user for a year (YYYY), filters the records to that year (excluding ads), and prints the total count.
-    It then generates two bar charts using Plotly Express:
+    Prompts the user for a year (YYYY), takes the records of that year (excluding ads) from videos_by_year, and prints the total count.
+    It then generates two bar charts:
       1. Videos watched per month (aggregated by YYYY-MM).
       2. Videos watched per year.
 
@@ -675,16 +817,15 @@ def plot_videos_year(): # 15
     """
     year_str = input("Ano para listar (YYYY): ").strip()
 
-    year_records = [r for r in records if r["view_date"].year == int(year_str) and record_without_ad(r)]
+    year = int(year_str)
+    year_records = videos_by_year.get(year, [])
     total = len(year_records)
     line()
     print(f"Quantidade de vídeos assistidos em {year_str}: {total}")
     line()
 
-    count = Counter(r["view_date"].strftime("%Y-%m") for r in year_records)
-    graph_data = [{"Month": month, "Count": count} for month, count in count.items()]
-    fig = px.bar(graph_data, x="Month", y="Count", title=f"Vídeos assistidos por mês em {year_str}")
-    fig.show()
+    count = Counter(r["ym_str"] for r in year_records)
+    show_bar(list(count.keys()), list(count.values()), f"Vídeos assistidos por mês em {year_str}", "Month", "Count")
 
 
 def plot_videos_total(): # 16
@@ -692,36 +833,31 @@ def plot_videos_total(): # 16
     Plot overall bar charts for total videos watched (excluding ads).
 
     The function first prints the total number of videos watched.
-    It then generates two bar charts using Plotly Express:
+    It then generates two bar charts:
       1. Videos watched per Year-Month.
       2. Videos watched per Year.
 
     Returns:
         None
     """
-    filtered_records = [r for r in records if record_without_ad(r)]
-    total = len(filtered_records)
+    total = len(records_without_ads)
     line()
     print(f"Quantidade total de vídeos assistidos: {total}")
     line()
 
-    month_count = Counter(r["view_date"].strftime("%Y-%m") for r in filtered_records)
-    month_data = [{"Year-Month": month, "Count": count} for month, count in month_count.items()]
-    fig1 = px.bar(month_data, x="Year-Month", y="Count", title="Vídeos assistidos por Ano-Mês")
-    fig1.show()
+    month_count = Counter(r["ym_str"] for r in records_without_ads)
+    show_bar(list(month_count.keys()), list(month_count.values()), "Vídeos assistidos por Ano-Mês", "Year-Month", "Count")
     
-    year_count = Counter(r["view_date"].year for r in filtered_records)
-    year_data = [{"Year": year, "Count": count} for year, count in year_count.items()]
-    fig2 = px.bar(year_data, x="Year", y="Count", title="Vídeos assistidos por Ano")
-    fig2.show()
+    year_count = Counter(r["year"] for r in records_without_ads)
+    show_bar(list(year_count.keys()), list(year_count.values()), "Vídeos assistidos por Ano", "Year", "Count")
 
 
 def plot_channels_day(): # 17
     """
     Plot a bar chart of channels accessed on a specific day.
 
-    Prompts the user for a specific date (YYYY-MM-DD), retrieves the videos for that day,
-    then aggregates and counts the number of videos per channel. A bar chart is generated using Plotly Express
+    Prompts the user for a specific date (YYYY-MM-DD) once, retrieves the videos for that day with videos_for_date,
+    then aggregates and counts the number of videos per channel. A bar chart is generated
     to show the frequency of each channel accessed.
 
     Returns:
@@ -729,7 +865,7 @@ def plot_channels_day(): # 17
     """
     date_str = input("Data para listar (YYYY-MM-DD): ").strip()
 
-    videos = list_videos_by_date()
+    videos = videos_for_date(datetime.strptime(date_str, "%Y-%m-%d").date())
     channels_dict = {}
     for r in videos:
         if r["channel_name"] in channels_dict:
@@ -741,65 +877,62 @@ def plot_channels_day(): # 17
     print(f"Quantidade de canais assistidos em {date_str}: {total}")
     line()
 
-    graph_data = [{"Channel": channel, "Frequency": freq} for channel, freq in channels_dict.items()]
-    fig = px.bar(graph_data, x="Channel", y="Frequency", title=f"Canais acessados em {date_str}")
-    fig.show()
+    show_bar(list(channels_dict.keys()), list(channels_dict.values()), f"Canais acessados em {date_str}", "Channel", "Frequency")
 
 
 def plot_channels_month(): # 18
     """
     Plot a bar chart of unique channels watched per day in a specified month.
 
-    Prompts the user for a month in the format YYYY-MM, filters the records (excluding ads) for that month,
+    Prompts the user for a month in the format YYYY-MM, takes the records (excluding ads) of that month from videos_by_month,
     and aggregates unique channels per day. It then prints the total number of channels viewed in that month and
-    displays a bar chart using Plotly Express.
+    displays a bar chart.
 
     Returns:
         None
     """
     month_str = input("Mês para listar (YYYY-MM): ").strip()
 
-    month_records = [r for r in records if r["view_date"].strftime("%Y-%m") == month_str and record_without_ad(r)]
+    month_records = videos_by_month.get(month_str, [])
     channels_per_day = defaultdict(set)
     for r in month_records:
-        day = r["view_date"].strftime("%Y-%m-%d")
+        day = r["day_str"]
         channels_per_day[day].add(r["channel_name"])
-    graph_data = [{"Day": day, "Unique Channels": len(channels)} for day, channels in channels_per_day.items()]
-    total = sum(len(channels) for channels in channels_per_day.values())
+    unique_counts = [len(channels) for channels in channels_per_day.values()]
+    total = sum(unique_counts)
     line()
     print(f"Quantidade total de canais assistidos em {month_str}: {total}")
     line()
 
-    fig = px.bar(graph_data, x="Day", y="Unique Channels", title=f"Canais únicos por dia em {month_str}")
-    fig.show()
+    show_bar(list(channels_per_day.keys()), unique_counts, f"Canais únicos por dia em {month_str}", "Day", "Unique Channels")
 
 
 def plot_channels_year(): # 19
     """
     Plot a bar chart of unique channels watched per month in a specified year.
 
-    Prompts the user for a year (YYYY), filters records for that year (excluding ads),
+    Prompts the user for a year (YYYY), takes the records of that year (excluding ads) from videos_by_year,
     and groups them by month, aggregating unique channel names for each month.
-    The chart is generated using Plotly Express.
+    The results are shown in a bar chart.
 
     Returns:
         None
     """
     year_str = input("Ano para listar (YYYY): ").strip()
 
-    year_records = [r for r in records if r["view_date"].year == int(year_str) and record_without_ad(r)]
+    year = int(year_str)
+    year_records = videos_by_year.get(year, [])
     channels_per_month = defaultdict(set)
     for r in year_records:
-        month = r["view_date"].strftime("%Y-%m")
+        month = r["ym_str"]
         channels_per_month[month].add(r["channel_name"])
-    graph_data = [{"Month": month, "Unique Channels": len(channels)} for month, channels in channels_per_month.items()]
-    total = sum(len(channels) for channels in channels_per_month.values())
+    unique_counts = [len(channels) for channels in channels_per_month.values()]
+    total = sum(unique_counts)
     line()
     print(f"Quantidade total de canais assistidos em {year_str}: {total}")
     line()
 
-    fig = px.bar(graph_data, x="Month", y="Unique Channels", title=f"Canais únicos por mês em {year_str}")
-    fig.show()
+    show_bar(list(channels_per_month.keys()), unique_counts, f"Canais únicos por mês em {year_str}", "Month", "Unique Channels")
 
 
 def plot_channels_total(): # 20
@@ -807,85 +940,71 @@ def plot_channels_total(): # 20
     Plot overall bar charts for unique channels watched across all records (excluding ads).
 
     The function calculates the total number of unique channels watched.
-    It then generates two bar charts using Plotly Express:
+    It then generates two bar charts:
       1. Unique channels per Year-Month.
       2. Unique channels per Year.
 
     Returns:
         None
     """
-    filtered_records = [r for r in records if record_without_ad(r)]
-
-    total_channels = set(r["channel_name"] for r in filtered_records)
+    total_channels = set(r["channel_name"] for r in records_without_ads)
     line()
     print(f"Quantidade total de canais assistidos: {len(total_channels)}")
     line()
 
     channels_per_month = defaultdict(set)
-    for r in filtered_records:
-        month = r["view_date"].strftime("%Y-%m")
+    for r in records_without_ads:
+        month = r["ym_str"]
         channels_per_month[month].add(r["channel_name"])
-    month_data = [{"Year-Month": month, "Unique Channels": len(channels)} for month, channels in channels_per_month.items()]
-    fig1 = px.bar(month_data, x="Year-Month", y="Unique Channels", title="Canais únicos por Ano-Mês")
-    fig1.show()
+    show_bar(list(channels_per_month.keys()), [len(channels) for channels in channels_per_month.values()],
+             "Canais únicos por Ano-Mês", "Year-Month", "Unique Channels")
 
     most_watched_channels_by_year = defaultdict(set)
-    for r in filtered_records:
-        year = r["view_date"].year
+    for r in records_without_ads:
+        year = r["year"]
         most_watched_channels_by_year[year].add(r["channel_name"])
-    year_data = [{"Year": year, "Unique Channels": len(channels)} for year, channels in most_watched_channels_by_year.items()]
-    fig2 = px.bar(year_data, x="Year", y="Unique Channels", title="Canais únicos por Ano")
-    fig2.show()
+    show_bar(list(most_watched_channels_by_year.keys()), [len(channels) for channels in most_watched_channels_by_year.values()],
+             "Canais únicos por Ano", "Year", "Unique Channels")
 
 
 def most_watched_ads(): # 21
     """
     List the most-watched advertisements based on watch frequency.
 
-    Prompts the user for the number of top records to list. This function filters for records that contain ad content
-    (i.e. where record_without_ad returns False), counts the occurrences of each ad video title, and prints the results.
+    Prompts the user for the number of top records to list. This function takes the ad records collected in index_records
+    (i.e. where the "is_ad" flag is set), counts the occurrences of each ad video title, and prints the results.
 
     Returns:
         None
     """
     quantity = int(input("Quantidade de registros para listar: "))
-    ads_filtered_records = [r for r in records if not record_without_ad(r)]
-    count = Counter(r["video_title"] for r in ads_filtered_records)
+    count = Counter(r["video_title"] for r in ad_records)
     results = count.most_common(quantity)
     
-    line()
-    for title, cnt in results:
-        print(f"{cnt:02d} vezes - {title}")
-    line()
+    print_block(f"{cnt:02d} vezes - {title}" for title, cnt in results)
 
 
 def most_watched_ads_by_year(): # 22
     """
     List the most-watched advertisements per year based on watch frequency.
 
-    Prompts the user for the number of top records to list. The function groups records containing ad content by year,
+    Prompts the user for the number of top records to list. The function takes the ad records grouped by year in index_records,
     counts the frequency of each ad video title in each year, and prints the top ads along with their counts for every year.
 
     Returns:
         None
     """
     quantity = int(input("Quantidade de registros para listar: "))
-    ads_by_year = defaultdict(list)
-    for r in records:
-        if not record_without_ad(r):
-            year_val = r["view_date"].year
-            ads_by_year[year_val].append(r["video_title"])
     results = {}
-    for year, ads in ads_by_year.items():
-        cont = Counter(ads)
+    for year, year_ads in ads_by_year.items():
+        cont = Counter(r["video_title"] for r in year_ads)
         results[year] = cont.most_common(quantity)
     
-    line()
+    output = []
     for year in sorted(results.keys()):
-        print(f"\nAno {year}:")
-        for title, cnt in results[year]:
-            print(f"  {cnt:02d} vezes - {title}")
-    line()
+        output.append(f"\nAno {year}:")
+        output.extend(f"  {cnt:02d} vezes - {title}" for title, cnt in results[year])
+    print_block(output)
 
 
 def plot_ads_total(): # 23
@@ -893,7 +1012,7 @@ def plot_ads_total(): # 23
     Plot bar charts for total advertisement watches.
 
     This function calculates and prints the total number of advertisement records and its percentage from the overall records.
-    It generates two bar charts using Plotly Express:
+    It generates two bar charts:
       1. Ads watched per Year-Month.
       2. Ads watched per Year.
 
@@ -901,24 +1020,19 @@ def plot_ads_total(): # 23
         None
     """
     total_records = len(records)
-    ads_records = [r for r in records if not record_without_ad(r)]
-    total_ads = len(ads_records)
+    total_ads = len(ad_records)
     percentage = (total_ads / total_records * 100) if total_records else 0
     line()
     print(f"Quantidade total de propagandas: {total_ads} ({percentage:.2f}% do total)")
     line()
     
     # Contagem por mês (ano-mês)
-    month_count_ads = Counter(r["view_date"].strftime("%Y-%m") for r in ads_records)
-    month_data_ads = [{"Year-Month": month, "Count": count} for month, count in month_count_ads.items()]
-    fig1 = px.bar(month_data_ads, x="Year-Month", y="Count", title="Propagandas assistidas por Ano-Mês")
-    fig1.show()
+    month_count_ads = Counter(r["ym_str"] for r in ad_records)
+    show_bar(list(month_count_ads.keys()), list(month_count_ads.values()), "Propagandas assistidas por Ano-Mês", "Year-Month", "Count")
     
     # Contagem por ano
-    year_count_ads = Counter(r["view_date"].year for r in ads_records)
-    year_data_ads = [{"Year": year, "Count": count} for year, count in year_count_ads.items()]
-    fig2 = px.bar(year_data_ads, x="Year", y="Count", title="Propagandas assistidas por Ano")
-    fig2.show()
+    year_count_ads = Counter(r["year"] for r in ad_records)
+    show_bar(list(year_count_ads.keys()), list(year_count_ads.values()), "Propagandas assistidas por Ano", "Year", "Count")
 
 
 def plot_videos_by_hour(): # 24
@@ -926,21 +1040,17 @@ def plot_videos_by_hour(): # 24
     Plot a bar chart of videos watched by each hour of the day.
 
     The function extracts the hour from the view date of each record (if available),
-    counts the number of videos for each hour (0-23), and then uses Plotly Express to create a bar chart.
+    counts the number of videos for each hour (0-23), and then shows the counts in a bar chart.
 
     Returns:
         None
     """
-    # Extrai a hora de cada visualização (0-23)
-    hour_count = Counter(r["view_date"].hour for r in records if r["view_date"] is not None)
-    # Organiza os dados em ordem crescente de hora
-    hours = list(range(24))
-    counts = [hour_count.get(hour, 0) for hour in hours]
-    data = [{"Hour": hour, "Count": count} for hour, count in zip(hours, counts)]
-    
-    fig = px.bar(data, x="Hour", y="Count", title="Quantidade de vídeos assistidos por hora do dia",
-                 labels={"Hour": "Hora do Dia", "Count": "Quantidade de Vídeos"})
-    fig.show()
+    import numpy as np
+
+    # Extrai a hora de cada visualização (0-23); horas sem vídeos ficam com zero
+    hours = np.fromiter((r["hour"] for r in records_by_date), dtype=int)
+    show_bar(np.arange(24), np.bincount(hours, minlength=24),
+             "Quantidade de vídeos assistidos por hora do dia", "Hora do Dia", "Quantidade de Vídeos")
 
 
 def plot_videos_by_weekday(): # 25
@@ -948,23 +1058,18 @@ def plot_videos_by_weekday(): # 25
     Plot a bar chart of videos watched by weekday.
 
     The function maps weekday numbers (0 for Monday through 6 for Sunday) to their names, counts the number
-    of videos watched on each weekday (excluding records without a valid view_date), and plots the results with Plotly Express.
+    of videos watched on each weekday (excluding records without a valid view_date), and plots the results in a bar chart.
 
     Returns:
         None
     """
-    # Mapeamento dos números dos dias (0=segunda, 6=domingo) para nomes
-    weekday_names = {0: "Segunda", 1: "Terça", 2: "Quarta", 3: "Quinta",
-                     4: "Sexta", 5: "Sábado", 6: "Domingo"}
-    weekday_count = Counter(r["view_date"].weekday() for r in records if r["view_date"] is not None)
-    # Ordena pelos dias da semana (0 a 6)
-    data = [{"Weekday": weekday_names.get(day, str(day)), "Count": weekday_count.get(day, 0)} 
-            for day in range(7)]
-    
-    fig = px.bar(data, x="Weekday", y="Count", 
-                 title="Quantidade de vídeos assistidos por dia da semana",
-                 labels={"Weekday": "Dia da Semana", "Count": "Quantidade de Vídeos"})
-    fig.show()
+    import numpy as np
+
+    # Nomes dos dias na ordem de weekday() (0=segunda, 6=domingo)
+    weekday_names = ["Segunda", "Terça", "Quarta", "Quinta", "Sexta", "Sábado", "Domingo"]
+    weekdays = np.fromiter((r["weekday"] for r in records_by_date), dtype=int)
+    show_bar(weekday_names, np.bincount(weekdays, minlength=7),
+             "Quantidade de vídeos assistidos por dia da semana", "Dia da Semana", "Quantidade de Vídeos")
 
 
 def plot_videos_by_day_of_month(): # 26
@@ -972,20 +1077,17 @@ def plot_videos_by_day_of_month(): # 26
     Plot a bar chart of videos watched for each day of the month.
 
     Extracts the day of the month (1 to 31) from each record's view date,
-    counts the number of videos for each day, and displays the data using Plotly Express.
+    counts the number of videos for each day, and displays the data in a bar chart.
 
     Returns:
         None
     """
-    # Dia do mês varia de 1 a 31
-    day_count = Counter(r["view_date"].day for r in records if r["view_date"] is not None)
-    days = list(range(1, 32))
-    data = [{"Day": day, "Count": day_count.get(day, 0)} for day in days]
-    
-    fig = px.bar(data, x="Day", y="Count", 
-                 title="Quantidade de vídeos assistidos por dia do mês",
-                 labels={"Day": "Dia do Mês", "Count": "Quantidade de Vídeos"})
-    fig.show()
+    import numpy as np
+
+    # Dia do mês varia de 1 a 31 (a posição 0 da contagem é descartada)
+    days = np.fromiter((r["day"] for r in records_by_date), dtype=int)
+    show_bar(np.arange(1, 32), np.bincount(days, minlength=32)[1:],
+             "Quantidade de vídeos assistidos por dia do mês", "Dia do Mês", "Quantidade de Vídeos")
 
 
 def plot_videos_by_month(): # 27
@@ -993,113 +1095,139 @@ def plot_videos_by_month(): # 27
     Plot a bar chart of videos watched by month.
 
     Extracts the month number (1-12) from each record's view date, maps it to its corresponding
-    abbreviated month name, counts the number of videos for each month, and displays the bar chart via Plotly Express.
+    abbreviated month name, counts the number of videos for each month, and displays the bar chart.
 
     Returns:
         None
     """
-    # Extrai o número do mês (1 a 12) e mapeia para o nome abreviado
-    month_names = {1: "Jan", 2: "Fev", 3: "Mar", 4: "Abr", 5: "Mai", 6: "Jun",
-                   7: "Jul", 8: "Ago", 9: "Set", 10: "Out", 11: "Nov", 12: "Dez"}
-    month_count = Counter(r["view_date"].month for r in records if r["view_date"] is not None)
-    # Garante a ordem de 1 a 12
-    data = [{"Month": month_names.get(month, str(month)), "Count": month_count.get(month, 0)}
-            for month in range(1, 13)]
-    
-    fig = px.bar(data, x="Month", y="Count", 
-                 title="Quantidade de vídeos assistidos por mês",
-                 labels={"Month": "Mês", "Count": "Quantidade de Vídeos"})
-    fig.show()
+    import numpy as np
+
+    # Nomes abreviados dos meses, de 1 a 12 (a posição 0 da contagem é descartada)
+    month_names = ["Jan", "Fev", "Mar", "Abr", "Mai", "Jun", "Jul", "Ago", "Set", "Out", "Nov", "Dez"]
+    months = np.fromiter((r["month"] for r in records_by_date), dtype=int)
+    show_bar(month_names, np.bincount(months, minlength=13)[1:],
+             "Quantidade de vídeos assistidos por mês", "Mês", "Quantidade de Vídeos")
+
+
+# Função executada por cada opção do menu (a opção "0" encerra o programa)
+MENU_ACTIONS = {
+    "1": list_first_videos,
+    "2": list_first_videos_by_year,
+    "3": list_by_channel,
+    "4": most_watched_videos,
+    "5": most_watched_videos_by_year,
+    "6": most_watched_channels,
+    "7": most_watched_channels_by_year,
+    "8": most_watched_days,
+    "9": most_watched_days_by_year,
+    "10": list_videos_by_date,
+    "11": list_channels_by_date,
+    "12": search_by_title,
+    "13": plot_videos_day,
+    "14": plot_videos_month,
+    "15": plot_videos_year,
+    "16": plot_videos_total,
+    "17": plot_channels_day,
+    "18": plot_channels_month,
+    "19": plot_channels_year,
+    "20": plot_channels_total,
+    "21": most_watched_ads,
+    "22": most_watched_ads_by_year,
+    "23": plot_ads_total,
+    "24": plot_videos_by_hour,
+    "25": plot_videos_by_weekday,
+    "26": plot_videos_by_day_of_month,
+    "27": plot_videos_by_month,
+}
 
 
-def menu():
+def menu(quiet=False):
+    # Com a entrada redirecionada (pipe ou arquivo), as opções são lidas direto do buffer de sys.stdin
+    interactive = sys.stdin.isatty()
     while True:
-        print("\n- Opções -")
-        print("\nPrimeiros vídeos")
-        print("1. Primeiros vídeos assistidos")
-        print("2. Primeiros vídeos assistidos por ano")
-        print("3. Primeiros vídeos de um canal")
+        # No modo silencioso a lista de opções não é exibida, só o pedido da opção
+        if not quiet:
+            print("\n- Opções -")
+            print("\nPrimeiros vídeos")
+            print("1. Primeiros vídeos assistidos")
+            print("2. Primeiros vídeos assistidos por ano")
+            print("3. Primeiros vídeos de um canal")
         
-        print("\nMais assistidos")
-        print("4. Vídeos que mais assistiu")
-        print("5. Vídeos que mais assistiu por ano")
-        print("6. Canais mais assistidos")
-        print("7. Canais mais assistidos por ano")
-        print("8. Dias com mais vídeos assistidos")
-        print("9. Dias com mais vídeos assistidos por ano")
+            print("\nMais assistidos")
+            print("4. Vídeos que mais assistiu")
+            print("5. Vídeos que mais assistiu por ano")
+            print("6. Canais mais assistidos")
+            print("7. Canais mais assistidos por ano")
+            print("8. Dias com mais vídeos assistidos")
+            print("9. Dias com mais vídeos assistidos por ano")
         
-        print("\nPor data")
-        print("10. Vídeos de uma data")
-        print("11. Canais de uma data")
+            print("\nPor data")
+            print("10. Vídeos de uma data")
+            print("11. Canais de uma data")
         
-        print("\nPor título")
-        print("12. Vídeos por título")
+            print("\nPor título")
+            print("12. Vídeos por título")
         
-        print("\nQuantidade de vídeos")
-        print("13. Quantidade de vídeos de um dia específico (com gráfico por vídeo)")
-        print("14. Quantidade de vídeos de um mês específico (com gráfico por dia)")
-        print("15. Quantidade de vídeos de um ano específico (com gráfico por mês)")
-        print("16. Quantidade de vídeos totais (com gráfico por mês e ano)")
+            print("\nQuantidade de vídeos")
+            print("13. Quantidade de vídeos de um dia específico (com gráfico por vídeo)")
+            print("14. Quantidade de vídeos de um mês específico (com gráfico por dia)")
+            print("15. Quantidade de vídeos de um ano específico (com gráfico por mês)")
+            print("16. Quantidade de vídeos totais (com gráfico por mês e ano)")
         
-        print("\nQuantiddade de canais")
-        print("17. Quantidade de canais de um dia específico (com gráfico por canal)")
-        print("18. Quantidade de canais de um mês específico (com gráfico por dia)")
-        print("19. Quantidade de canais de um ano específico (com gráfico por mês)")
-        print("20. Quantidade de canais totais (com gráfico por mês e ano)")
+            print("\nQuantiddade de canais")
+            print("17. Quantidade de canais de um dia específico (com gráfico por canal)")
+            print("18. Quantidade de canais de um mês específico (com gráfico por dia)")
+            print("19. Quantidade de canais de um ano específico (com gráfico por mês)")
+            print("20. Quantidade de canais totais (com gráfico por mês e ano)")
         
-        print("\nPropagandas")
-        print("21. Propagandas que mais assistiu")
-        print("22. Propagandas que mais assistiu por ano")
-        print("23. Quantidade de propagandas totais (com gráfico por mês e ano)")
+            print("\nPropagandas")
+            print("21. Propagandas que mais assistiu")
+            print("22. Propagandas que mais assistiu por ano")
+            print("23. Quantidade de propagandas totais (com gráfico por mês e ano)")
         
-        print("\nTendências")
-        print("24. Horários que mais assiste vídeo")
-        print("25. Dias da semana que mais assiste vídeo")
-        print("26. Dias do mês que mais assiste vídeo")
-        print("27. Meses que mais assiste vídeo")
+            print("\nTendências")
+            print("24. Horários que mais assiste vídeo")
+            print("25. Dias da semana que mais assiste vídeo")
+            print("26. Dias do mês que mais assiste vídeo")
+            print("27. Meses que mais assiste vídeo")
         
-        print("")
-        print("0. Sair")
-        print("")
-        option = input("Escolha uma opção: ").strip()
+            print("")
+            print("0. Sair")
+            print("")
+        if interactive:
+            option = input("Escolha uma opção: ").strip()
+        else:
+            sys.stdout.write("Escolha uma opção: ")
+            raw_option = sys.stdin.readline()
+            # Fim da entrada redirecionada: encerra como a opção "0"
+            if not raw_option:
+                print("")
+                break
+            option = raw_option.strip()
         
-        if option == "0": break
-        elif option == "1": list_first_videos()
-        elif option == "2": list_first_videos_by_year()
-        elif option == "3": list_by_channel()
-        elif option == "4": most_watched_videos()
-        elif option == "5": most_watched_videos_by_year()
-        elif option == "6": most_watched_channels()
-        elif option == "7": most_watched_channels_by_year()
-        elif option == "8": most_watched_days()
-        elif option == "9": most_watched_days_by_year()
-        elif option == "10": list_videos_by_date()
-        elif option == "11": list_channels_by_date()
-        elif option == "12": search_by_title()
-        elif option == "13": plot_videos_day()
-        elif option == "14": plot_videos_month()
-        elif option == "15": plot_videos_year()
-        elif option == "16": plot_videos_total()
-        elif option == "17": plot_channels_day()
-        elif option == "18": plot_channels_month()
-        elif option == "19": plot_channels_year()
-        elif option == "20": plot_channels_total()
-        elif option == "21": most_watched_ads()
-        elif option == "22": most_watched_ads_by_year()
-        elif option == "23": plot_ads_total()
-        elif option == "24": plot_videos_by_hour()
-        elif option == "25": plot_videos_by_weekday()
-        elif option == "26": plot_videos_by_day_of_month()
-        elif option == "27": plot_videos_by_month()
-        else: print("Opção inválida. Tente novamente.")
+        if option == "0":
+            break
+        action = MENU_ACTIONS.get(option)
+        if action is None:
+            print("Opção inválida. Tente novamente.")
+        else:
+            action()
 
 def main():
-    print("Iniciando análise...")
+    parser = argparse.ArgumentParser(description="Analisador do histórico do YouTube exportado pelo Google Takeout.")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="não exibe as mensagens de início nem a lista de opções do menu")
+    parser.add_argument("--option", choices=list(MENU_ACTIONS), metavar="N",
+                        help="executa diretamente a opção N do menu (1-27) e encerra")
+    args = parser.parse_args()
+
+    if not args.quiet:
+        print("Iniciando análise...")
     
     try:
-        global records
         file_path = os.path.join("Takeout", 'YouTube e YouTube Music', 'histórico', 'histórico-de-visualização.html')
-        records = parse_html(file_path)
+        # Preenche a lista do módulo no lugar: se a leitura falhar, ela continua vazia
+        records[:] = load_records(file_path, args.quiet)
 
     except Exception as e:
         print("Erro ao processar arquivo:")
@@ -1107,8 +1235,13 @@ def main():
 
     finally:
         if len(records) > 0:
-            print(f"\nForam encontrados {len(records)} registros no arquivo original.")
-            menu()
+            if not args.quiet:
+                print(f"\nForam encontrados {len(records)} registros no arquivo original.")
+            index_records()
+            if args.option:
+                MENU_ACTIONS[args.option]()
+            else:
+                menu(args.quiet)
         else:
             print("Nenhum registro encontrado.")
 